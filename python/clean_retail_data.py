@@ -12,27 +12,82 @@ also derives the following fields:
 * **Revenue** – calculated as ``Quantity × PricePerUnit``.
 * **Basket Size** – synonymous with ``Quantity`` to emphasise the number
   of items in each transaction.
-* **Month** – a ``YYYY-MM`` string extracted from the sale date.
-* **Quarter** – a ``Qx-YYYY`` string derived from the sale date.
+* **Month** – the sale month, held as a ``YYYYMM`` integer and written
+  to CSV output as a ``YYYY-MM`` string.
+* **Quarter** – the sale quarter, held as a ``YYYYQ`` integer and written
+  to CSV output as a ``Qx-YYYY`` string.
 
 Usage
 -----
 
-Run this script from the command line, specifying the input and output
-CSV paths.  For example:
+Run this script from the command line, specifying the input CSV and output
+paths.  For example:
 
 ```
-python clean_retail_data.py --input retail_sales_full_dataset.csv --output retail_sales_clean.csv
+python clean_retail_data.py --input retail_sales_full_dataset.csv --output retail_sales_clean.parquet
 ```
 
-If no output path is provided, the script writes ``retail_sales_clean.csv``
-in the current directory.  The input CSV must contain the columns
+The cleaned data is written as zstd-compressed Parquet by default, which the
+analysis scripts load much faster than CSV.  Pass ``--format csv`` to write
+a CSV file instead.  If no output path is provided, the script writes
+``retail_sales_clean.parquet`` (or ``retail_sales_clean.csv``) in the
+current directory.  The input CSV must contain the columns
 ``Transaction ID``, ``Date``, ``Customer ID``, ``Gender``, ``Age``,
 ``Product Category``, ``Quantity``, ``Price per Unit`` and ``Total Amount``.
 """
 
 import argparse
+import os
+from collections.abc import Iterator
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+# Low-cardinality labels stored as categoricals in memory and as
+# dictionary-encoded columns (int32 codes) in Parquet
+CATEGORICAL_COLUMNS = ('Gender', 'ProductCategory')
+DICTIONARY_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+# Raw rows are read and cleaned in blocks of this many bytes
+BLOCK_SIZE = 16 << 20
+
+# Mapping from the raw column names to the names used in the analysis
+RENAME_MAP = {
+    'Transaction ID': 'TransactionID',
+    'Date': 'SaleDate',
+    'Customer ID': 'CustomerID',
+    'Product Category': 'ProductCategory',
+    'Price per Unit': 'PricePerUnit',
+    'Total Amount': 'TotalAmount'
+}
+
+
+def period_keys(sale_dates: pd.Series) -> tuple[pd.arrays.IntegerArray, pd.arrays.IntegerArray]:
+    """Compute integer month and quarter keys for a column of sale dates.
+
+    Parameters
+    ----------
+    sale_dates : pd.Series
+        Datetime column (NumPy or Arrow backed).
+
+    Returns
+    -------
+    tuple[pd.arrays.IntegerArray, pd.arrays.IntegerArray]
+        ``YYYYMM`` month keys and ``YYYYQ`` quarter keys as nullable
+        ``Int32`` arrays; missing dates give missing keys.
+    """
+    missing = sale_dates.isna().to_numpy()
+    # Months since 1970 fit comfortably in int32, so all the arithmetic
+    # stays in int32 and needs no final narrowing copy.  NaT rows produce
+    # garbage here and are masked out below.
+    months = sale_dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[M]').astype(np.int32)
+    year = 1970 + months // 12
+    month = months % 12 + 1
+    return (pd.arrays.IntegerArray(year * 100 + month, missing),
+            pd.arrays.IntegerArray(year * 10 + (month - 1) // 3 + 1, missing))
 
 
 def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
@@ -49,27 +104,22 @@ def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
         Cleaned retail sales data with new columns and consistent naming.
     """
     # Standardise column names
-    rename_map = {
-        'Transaction ID': 'TransactionID',
-        'Date': 'SaleDate',
-        'Customer ID': 'CustomerID',
-        'Product Category': 'ProductCategory',
-        'Price per Unit': 'PricePerUnit',
-        'Total Amount': 'TotalAmount'
-    }
-    df = df.rename(columns=rename_map)
-
-    # Parse dates and drop time component
-    df['SaleDate'] = pd.to_datetime(df['SaleDate']).dt.date.astype(str)
+    df = df.rename(columns=RENAME_MAP)
+
+    # Store the low-cardinality labels as categoricals (small integer codes)
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype('category')
+
+    # Parse dates and drop time component; SaleDate stays a datetime column
+    # and is only formatted as YYYY-MM-DD when writing CSV
+    df['SaleDate'] = pd.to_datetime(df['SaleDate']).astype('datetime64[ns]').dt.normalize()
 
     # Compute revenue and basket size
     df['Revenue'] = df['Quantity'] * df['PricePerUnit']
     df['Basket Size'] = df['Quantity']
 
-    # Derive month and quarter
-    sale_dates = pd.to_datetime(df['SaleDate'])
-    df['Month'] = sale_dates.dt.strftime('%Y-%m')
-    df['Quarter'] = 'Q' + sale_dates.dt.quarter.astype(str) + '-' + sale_dates.dt.year.astype(str)
+    # Derive month (YYYYMM) and quarter (YYYYQ) as integers
+    df['Month'], df['Quarter'] = period_keys(df['SaleDate'])
 
     # Reorder columns for readability
     ordered_cols = [
@@ -80,30 +130,186 @@ def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
     return df[ordered_cols]
 
 
-def clean_file(input_path: str, output_path: str) -> None:
+def format_month(month: pd.Series) -> pd.Series:
+    """Format ``YYYYMM`` integer months as ``YYYY-MM`` strings.
+
+    Missing months stay missing (written as empty CSV cells).  Columns that
+    are already strings are returned unchanged.
+    """
+    if not pd.api.types.is_integer_dtype(month):
+        return month
+    values = month.astype('Int64')
+    return (values // 100).astype('string') + '-' + (values % 100).astype('string').str.zfill(2)
+
+
+def format_quarter(quarter: pd.Series) -> pd.Series:
+    """Format ``YYYYQ`` integer quarters as ``Qx-YYYY`` strings.
+
+    Missing quarters stay missing (written as empty CSV cells).  Columns
+    that are already strings are returned unchanged.
+    """
+    if not pd.api.types.is_integer_dtype(quarter):
+        return quarter
+    values = quarter.astype('Int64')
+    return 'Q' + (values % 10).astype('string') + '-' + (values // 10).astype('string')
+
+
+def format_amount(amount: pd.Series) -> pd.Series:
+    """Format amounts as the shortest text that reads back exactly.
+
+    Whole amounts are written without a trailing ``.0`` (``50`` rather than
+    ``50.0``), as they were when the raw integer columns were written back.
+    Missing amounts stay missing.
+    """
+    return amount.astype(pd.ArrowDtype(pa.string()))
+
+
+def parquet_schema(schema: pa.Schema) -> pa.Schema:
+    """Return ``schema`` with the categorical columns dictionary-encoded.
+
+    Casting every batch to this schema pins the dictionary index and value
+    types, so batches whose categories differ still share one file schema.
+    """
+    return pa.schema(
+        [field.with_type(DICTIONARY_TYPE) if field.name in CATEGORICAL_COLUMNS else field
+         for field in schema],
+        metadata=schema.metadata,
+    )
+
+
+def read_cleaned(path: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """Load a cleaned retail sales file written by ``clean_file``.
+
+    Parameters
+    ----------
+    path : str
+        Path to a cleaned ``.parquet`` or ``.csv`` file.
+    columns : list[str], optional
+        Only read these columns.  All columns are read by default.
+
+    Returns
+    -------
+    pd.DataFrame
+        Cleaned retail sales data with Arrow-backed columns; dictionary-encoded
+        Parquet columns are returned as pandas categoricals.
+    """
+    if path.endswith('.parquet'):
+        # pandas cannot cast an Arrow dictionary column holding nulls to
+        # 'category', so convert dictionary columns to categoricals directly
+        return pq.read_table(path, columns=columns).to_pandas(
+            types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t))
+    return pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow', usecols=columns)
+
+
+def iter_clean_batches(input_path: str, block_size: int = BLOCK_SIZE) -> Iterator[pd.DataFrame]:
+    """Stream a raw CSV in record batches and clean each one.
+
+    ``clean_dataset`` only performs per-row transformations, so cleaning the
+    file batch by batch gives the same result as cleaning it in one go while
+    keeping at most one batch in memory.
+
+    Parameters
+    ----------
+    input_path : str
+        Path to the raw retail sales CSV file.
+    block_size : int
+        Approximate number of bytes of CSV text per batch.
+
+    Yields
+    ------
+    pd.DataFrame
+        Cleaned retail sales data for one batch of raw rows.
+    """
+    reader = pa_csv.open_csv(
+        input_path,
+        read_options=pa_csv.ReadOptions(block_size=block_size),
+        convert_options=pa_csv.ConvertOptions(column_types={
+            'Date': pa.timestamp('ms'),
+            'Quantity': pa.int32(),
+            'Price per Unit': pa.float64(),
+        }, strings_can_be_null=True),
+    )
+    empty = True
+    for batch in reader:
+        empty = False
+        yield clean_dataset(batch.to_pandas(types_mapper=pd.ArrowDtype))
+    # A file with only a header row has no batches; still yield one empty
+    # batch so that callers see the cleaned columns
+    if empty:
+        yield clean_dataset(reader.schema.empty_table().to_pandas(types_mapper=pd.ArrowDtype))
+
+
+def clean_file(input_path: str, output_path: str, output_format: str = 'parquet') -> str:
     """Load a raw CSV, clean it and write the result to a new file.
 
+    The raw file is streamed with ``iter_clean_batches`` so that peak memory
+    is bounded by the batch size rather than the file size.
+
     Parameters
     ----------
     input_path : str
         Path to the raw retail sales CSV file.
     output_path : str
-        Destination path for the cleaned CSV file.
+        Destination path for the cleaned file.  For Parquet output the
+        extension is replaced with ``.parquet``.
+    output_format : str
+        ``'parquet'`` (default) or ``'csv'``.
+
+    Returns
+    -------
+    str
+        Path of the file that was written.
     """
-    raw_df = pd.read_csv(input_path)
-    cleaned_df = clean_dataset(raw_df)
-    cleaned_df.to_csv(output_path, index=False)
-    print(f"Cleaned data saved to {output_path}. Rows: {len(cleaned_df)}; Columns: {len(cleaned_df.columns)}")
+    if output_format == 'parquet':
+        output_path = os.path.splitext(output_path)[0] + '.parquet'
+
+    # Write to a temporary file and only move it into place once every batch
+    # has been written, so a failed run never leaves a partial output file
+    tmp_path = f'{output_path}.{os.getpid()}.tmp'
+    writer = None
+    rows = columns = 0
+    try:
+        for cleaned_df in iter_clean_batches(input_path):
+            if output_format == 'parquet':
+                table = pa.Table.from_pandas(cleaned_df, preserve_index=False)
+                if writer is None:
+                    schema = parquet_schema(table.schema)
+                    writer = pq.ParquetWriter(tmp_path, schema, compression='zstd')
+                writer.write_table(table.cast(schema))
+            else:
+                cleaned_df.assign(SaleDate=cleaned_df['SaleDate'].dt.strftime('%Y-%m-%d'),
+                                  Month=format_month(cleaned_df['Month']),
+                                  Quarter=format_quarter(cleaned_df['Quarter']),
+                                  PricePerUnit=format_amount(cleaned_df['PricePerUnit']),
+                                  TotalAmount=format_amount(cleaned_df['TotalAmount']),
+                                  Revenue=format_amount(cleaned_df['Revenue'])).to_csv(
+                    tmp_path, mode='a' if rows else 'w', header=not rows, index=False)
+            rows += len(cleaned_df)
+            columns = len(cleaned_df.columns)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if writer is not None:
+        writer.close()
+    os.replace(tmp_path, output_path)
+    print(f"Cleaned data saved to {output_path}. Rows: {rows}; Columns: {columns}")
+    return output_path
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Clean the raw retail sales data")
     parser.add_argument('-i', '--input', dest='input_path', required=True,
                         help='Path to the raw CSV file')
-    parser.add_argument('-o', '--output', dest='output_path', default='retail_sales_clean.csv',
-                        help='Path for the cleaned CSV file (default: retail_sales_clean.csv)')
+    parser.add_argument('-o', '--output', dest='output_path', default=None,
+                        help='Path for the cleaned file (default: retail_sales_clean.<format>)')
+    parser.add_argument('-f', '--format', dest='output_format', choices=('parquet', 'csv'), default='parquet',
+                        help='Output file format (default: parquet)')
     args = parser.parse_args()
-    clean_file(args.input_path, args.output_path)
+    output_path = args.output_path or f'retail_sales_clean.{args.output_format}'
+    clean_file(args.input_path, output_path, args.output_format)
 
 
 if __name__ == '__main__':
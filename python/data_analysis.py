@@ -8,40 +8,72 @@ for data manipulation and seaborn/matplotlib for basic visualisations.
 
 Functions are provided for:
 
-* Loading the CSV file and computing derived columns (Revenue, Basket Size,
-  Month, Quarter) if they are missing.
+* Loading the cleaned Parquet or CSV file and computing derived columns
+  (Revenue, Basket Size, Month, Quarter) if they are missing.
 * Summarising revenue and basket size by gender.
 * Summarising revenue and ticket metrics by product category.
 * Summarising revenue by month and quarter.
 * Plotting simple bar and line charts and saving them to PNG files.
+* Running the three question scripts on a single shared load of the data
+  (``run_all``).
 
 Run this script as a stand‑alone programme to generate summary tables and
-charts.  Modify the `CSV_PATH` variable in the ``if __name__ == '__main__'``
-section to point to your local CSV file.
+charts.  Pass ``--input`` or set the ``CSV_PATH`` environment variable to
+point it at your cleaned Parquet or CSV file.
 """
 
 import os
+import numpy as np
 import pandas as pd
-import seaborn as sns
+import matplotlib
+
+# Charts are only written to files, so use the non-interactive Agg backend
+# and never initialise a GUI toolkit
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+import seaborn as sns
+
+import q1_revenue_by_gender
+import q2_monthly_revenue
+import q3_product_performance
+from clean_retail_data import CATEGORICAL_COLUMNS, format_month, period_keys, read_cleaned
+from io_cache import load_cached
 
 sns.set(style="whitegrid")
+matplotlib.rcParams['savefig.dpi'] = 100
+matplotlib.rcParams['path.simplify'] = True
+
+# One figure is reused (cleared and resized) for every chart
+_FIG, _AX = plt.subplots()
+
+# pandas' parallel numba engine for the category group-by is opt-in
+# (NUMBA_GROUPBY=1).  pandas JIT-compiles its kernels again in every new
+# process, which costs several seconds, so it only pays off on large data.
+NUMBA_ENGINE = {
+    'engine': 'numba',
+    'engine_kwargs': {'parallel': True, 'nogil': True, 'nopython': True},
+} if os.getenv('NUMBA_GROUPBY') == '1' else {}
 
 
 def load_data(csv_path: str) -> pd.DataFrame:
-    """Load the retail sales CSV file and ensure required fields exist.
+    """Load the cleaned retail sales file and ensure required fields exist.
 
     Parameters
     ----------
     csv_path : str
-        Path to the CSV file.
+        Path to the cleaned ``.parquet`` or ``.csv`` file.
 
     Returns
     -------
     pd.DataFrame
         DataFrame with parsed dates and computed fields.
     """
-    df = pd.read_csv(csv_path)
+    df = read_cleaned(csv_path)
+
+    # Store the low-cardinality labels as categoricals (small integer codes)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
 
     # Parse SaleDate as datetime if present
     if 'SaleDate' in df.columns:
@@ -55,12 +87,13 @@ def load_data(csv_path: str) -> pd.DataFrame:
     if 'Basket Size' not in df.columns and 'Quantity' in df.columns:
         df['Basket Size'] = df['Quantity']
 
-    # Derive Month and Quarter if missing and SaleDate exists
+    # Derive Month (YYYYMM) and Quarter (YYYYQ) integers if missing and SaleDate exists
     if 'SaleDate' in df.columns:
+        month, quarter = period_keys(df['SaleDate'])
         if 'Month' not in df.columns:
-            df['Month'] = df['SaleDate'].dt.strftime('%Y-%m')
+            df['Month'] = month
         if 'Quarter' not in df.columns:
-            df['Quarter'] = df['SaleDate'].dt.to_period('Q').astype(str)
+            df['Quarter'] = quarter
 
     return df
 
@@ -79,14 +112,27 @@ def summarise_by_gender(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Summary table indexed by gender.
     """
-    summary = (
-        df.groupby('Gender')
-        .agg(Transactions=('Revenue', 'count'),
-             Total_Revenue=('Revenue', 'sum'),
-             Avg_Revenue=('Revenue', 'mean'),
-             Avg_Basket_Size=('Basket Size', 'mean'))
-        .reset_index()
-    )
+    # Weighted bincounts over the factorised codes replace a hash-based
+    # groupby for this low-cardinality key
+    codes, genders = pd.factorize(df['Gender'], sort=True)
+    n = len(genders)
+    revenue = df['Revenue'].to_numpy(np.float64, na_value=np.nan)
+    basket = df['Basket Size'].to_numpy(np.float64, na_value=np.nan)
+    # Like groupby's count/sum/mean, skip missing values column by column
+    has_revenue = (codes >= 0) & ~np.isnan(revenue)
+    has_basket = (codes >= 0) & ~np.isnan(basket)
+    transactions = np.bincount(codes[has_revenue], minlength=n)
+    total_revenue = np.bincount(codes[has_revenue], weights=revenue[has_revenue], minlength=n)
+    baskets = np.bincount(codes[has_basket], minlength=n)
+    total_basket = np.bincount(codes[has_basket], weights=basket[has_basket], minlength=n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        summary = pd.DataFrame({
+            'Gender': genders,
+            'Transactions': transactions,
+            'Total_Revenue': total_revenue,
+            'Avg_Revenue': total_revenue / transactions,
+            'Avg_Basket_Size': total_basket / baskets,
+        })
     return summary
 
 
@@ -103,12 +149,18 @@ def summarise_by_category(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Summary table indexed by product category.
     """
+    # Only carry the columns the aggregation needs through the groupby, as
+    # NumPy float columns (which the optional numba engine requires)
+    df = df[['ProductCategory', 'Revenue', 'PricePerUnit']].astype(
+        {'Revenue': np.float64, 'PricePerUnit': np.float64})
+    grouped = df.groupby('ProductCategory', observed=True)
     summary = (
-        df.groupby('ProductCategory')
-        .agg(Transactions=('Revenue', 'count'),
-             Total_Revenue=('Revenue', 'sum'),
-             Avg_Revenue=('Revenue', 'mean'),
-             Avg_Unit_Price=('PricePerUnit', 'mean'))
+        pd.DataFrame({
+            'Transactions': grouped['Revenue'].count(),
+            'Total_Revenue': grouped['Revenue'].sum(**NUMBA_ENGINE),
+            'Avg_Revenue': grouped['Revenue'].mean(**NUMBA_ENGINE),
+            'Avg_Unit_Price': grouped['PricePerUnit'].mean(**NUMBA_ENGINE),
+        })
         .reset_index()
         .sort_values('Total_Revenue', ascending=False)
     )
@@ -128,15 +180,31 @@ def summarise_by_month(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Total revenue per month.
     """
-    monthly = (
-        df.groupby('Month')
-        .agg(Revenue=('Revenue', 'sum'))
-        .reset_index()
-        .sort_values('Month')
-    )
+    # Sorting the (few) unique months here yields chronological output
+    # without a separate sort of the result; YYYY-MM strings and YYYYMM
+    # integers both sort chronologically
+    codes, months = pd.factorize(df['Month'], sort=True)
+    revenue = df['Revenue'].to_numpy(np.float64, na_value=np.nan)
+    # Skip missing months and missing revenue, as groupby's sum does
+    valid = (codes >= 0) & ~np.isnan(revenue)
+    revenue = np.bincount(codes[valid], weights=revenue[valid], minlength=len(months))
+    monthly = pd.DataFrame({'Month': months, 'Revenue': revenue})
     return monthly
 
 
+def _reset_axes(figsize: tuple[float, float]) -> plt.Axes:
+    """Clear the shared axes and resize the shared figure for a new chart."""
+    _AX.clear()
+    _FIG.set_size_inches(*figsize)
+    return _AX
+
+
+def _save_figure(out_path: str) -> None:
+    """Lay out the shared figure and save it as a PNG image."""
+    _FIG.tight_layout()
+    _FIG.savefig(out_path)
+
+
 def plot_revenue_by_gender(summary: pd.DataFrame, out_path: str) -> None:
     """Plot a bar chart of total revenue by gender.
 
@@ -147,17 +215,15 @@ def plot_revenue_by_gender(summary: pd.DataFrame, out_path: str) -> None:
     out_path : str
         File path to save the PNG image.
     """
-    plt.figure(figsize=(4, 4))
-    ax = sns.barplot(x='Gender', y='Total_Revenue', data=summary, palette='pastel')
-    plt.title('Total Revenue by Gender')
-    plt.ylabel('Total Revenue')
+    ax = _reset_axes((4, 4))
+    sns.barplot(x='Gender', y='Total_Revenue', data=summary, palette='pastel', ax=ax)
+    ax.set_title('Total Revenue by Gender')
+    ax.set_ylabel('Total Revenue')
     # Annotate bars with values
-    for idx, row in summary.iterrows():
-        ax.text(idx, row['Total_Revenue'] * 1.01, f"{row['Total_Revenue']:.0f}",
-                ha='center', va='bottom')
-    plt.tight_layout()
-    plt.savefig(out_path)
-    plt.close()
+    for bars in ax.containers:
+        ax.bar_label(bars, fmt='%.0f', padding=3)
+    ax.margins(y=0.1)
+    _save_figure(out_path)
 
 
 def plot_revenue_by_category(summary: pd.DataFrame, out_path: str) -> None:
@@ -170,17 +236,17 @@ def plot_revenue_by_category(summary: pd.DataFrame, out_path: str) -> None:
     out_path : str
         File path to save the PNG image.
     """
-    plt.figure(figsize=(6, 4))
-    ax = sns.barplot(x='ProductCategory', y='Total_Revenue', data=summary, palette='muted')
-    plt.title('Total Revenue by Product Category')
-    plt.xlabel('Product Category')
-    plt.ylabel('Total Revenue')
-    for idx, row in summary.iterrows():
-        ax.text(idx, row['Total_Revenue'] * 1.01, f"{row['Total_Revenue']:.0f}",
-                ha='center', va='bottom')
-    plt.tight_layout()
-    plt.savefig(out_path)
-    plt.close()
+    ax = _reset_axes((6, 4))
+    # Keep the revenue ranking; a categorical column would otherwise plot in category order
+    sns.barplot(x='ProductCategory', y='Total_Revenue', data=summary, palette='muted',
+                order=summary['ProductCategory'].astype(str), ax=ax)
+    ax.set_title('Total Revenue by Product Category')
+    ax.set_xlabel('Product Category')
+    ax.set_ylabel('Total Revenue')
+    for bars in ax.containers:
+        ax.bar_label(bars, fmt='%.0f', padding=3)
+    ax.margins(y=0.1)
+    _save_figure(out_path)
 
 
 def plot_monthly_revenue(monthly: pd.DataFrame, out_path: str) -> None:
@@ -193,22 +259,23 @@ def plot_monthly_revenue(monthly: pd.DataFrame, out_path: str) -> None:
     out_path : str
         File path to save the PNG image.
     """
-    plt.figure(figsize=(8, 4))
-    ax = sns.lineplot(x='Month', y='Revenue', data=monthly, marker='o')
-    plt.title('Monthly Revenue Trend')
-    plt.xlabel('Month')
-    plt.ylabel('Revenue')
-    plt.xticks(rotation=45)
-    for idx, row in monthly.iterrows():
-        plt.text(row['Month'], row['Revenue'] * 1.02, f"{row['Revenue']:.0f}",
-                 ha='center', va='bottom', fontsize=8)
-    plt.tight_layout()
-    plt.savefig(out_path)
-    plt.close()
+    # seaborn cannot plot Arrow-backed or integer month keys as categories,
+    # so hand it plain YYYY-MM strings
+    monthly = monthly.assign(Month=format_month(monthly['Month']).astype(str))
+    ax = _reset_axes((8, 4))
+    sns.lineplot(x='Month', y='Revenue', data=monthly, marker='o', ax=ax)
+    ax.set_title('Monthly Revenue Trend')
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Revenue')
+    ax.tick_params(axis='x', labelrotation=45)
+    for month, revenue in zip(monthly['Month'].to_numpy(), monthly['Revenue'].to_numpy()):
+        ax.annotate(f"{revenue:.0f}", (month, revenue * 1.02),
+                    ha='center', va='bottom', fontsize=8)
+    _save_figure(out_path)
 
 
 def main(csv_path: str) -> None:
-    """Run the full analysis on the provided CSV path.
+    """Run the full analysis on the provided cleaned data file.
 
     This will print summary tables to the console and save charts in the
     current working directory.
@@ -216,7 +283,7 @@ def main(csv_path: str) -> None:
     Parameters
     ----------
     csv_path : str
-        Path to the retail sales CSV file.
+        Path to the cleaned retail sales Parquet or CSV file.
     """
     df = load_data(csv_path)
 
@@ -227,7 +294,8 @@ def main(csv_path: str) -> None:
 
     print("Revenue by gender:\n", gender_summary.to_string(index=False))
     print("\nRevenue by category:\n", category_summary.to_string(index=False))
-    print("\nMonthly revenue:\n", monthly_summary.to_string(index=False))
+    print("\nMonthly revenue:\n",
+          monthly_summary.assign(Month=format_month(monthly_summary['Month'])).to_string(index=False))
 
     # Plot charts
     plot_revenue_by_gender(gender_summary, 'rev_by_gender.png')
@@ -236,35 +304,54 @@ def main(csv_path: str) -> None:
     print("\nCharts saved to current directory.")
 
 
+def run_all(input_path: str) -> None:
+    """Run the three question scripts on a single load of the cleaned data.
+
+    The file is read once (through the Parquet cache) and the same
+    DataFrame is passed to the ``main`` function of each question script.
+
+    Parameters
+    ----------
+    input_path : str
+        Path to the cleaned retail sales Parquet or CSV file.
+    """
+    df = load_cached(input_path)
+    q1_revenue_by_gender.main(df=df)
+    print()
+    q2_monthly_revenue.main(df=df)
+    print()
+    q3_product_performance.main(df=df)
+
+
 if __name__ == '__main__':
     """
-    When executed as a script, this module accepts an optional input CSV path
+    When executed as a script, this module accepts an optional input path
     via the ``--input`` argument.  If omitted, it falls back to the
-    ``CSV_PATH`` environment variable or ``retail_sales_clean.csv`` in the
-    current directory.
+    ``CSV_PATH`` environment variable or ``retail_sales_clean.parquet`` (the
+    cleaner's default output) in the current directory.
 
     Examples
     --------
     Run analysis on a specific file:
 
     ```bash
-    python python/data_analysis.py --input data/retail_sales_clean.csv
+    python python/data_analysis.py --input data/retail_sales_clean.parquet
     ```
 
     Or using an environment variable:
 
     ```bash
-    CSV_PATH=data/retail_sales_clean.csv python python/data_analysis.py
+    CSV_PATH=data/retail_sales_clean.parquet python python/data_analysis.py
     ```
     """
     import argparse
     parser = argparse.ArgumentParser(description="Analyse the cleaned retail sales data")
     parser.add_argument('-i', '--input', dest='input_path', default=None,
-                        help='Path to the cleaned CSV file')
+                        help='Path to the cleaned retail sales Parquet or CSV file')
     args = parser.parse_args()
 
-    # Determine CSV path: command-line > environment variable > default
+    # Determine input path: command-line > environment variable > default
     csv_env = os.getenv('CSV_PATH')
-    csv_path = args.input_path or csv_env or 'retail_sales_clean.csv'
+    csv_path = args.input_path or csv_env or 'retail_sales_clean.parquet'
 
     main(csv_path)
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+io_cache.py
+===========
+
+Caches the cleaned retail sales data as Parquet so that repeated runs of the
+analysis scripts do not re-parse the same CSV file.
+
+The cache key is derived from the absolute input path together with the
+file's modification time and size and a cache version, so editing or
+replacing the CSV, or changing the cached schema, invalidates its cached
+copy automatically.  Only the newest copy of each input path is kept.
+Cached files are stored under ``~/.cache/retail``.  Parquet inputs are already typed and fast to load, so
+they are read directly without caching.
+"""
+
+import glob
+import hashlib
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from clean_retail_data import CATEGORICAL_COLUMNS, parquet_schema, read_cleaned
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'retail')
+
+# Bump whenever the cached Parquet schema changes, so that copies written by
+# older code are not reused
+CACHE_VERSION = 2
+
+
+def load_cached(path: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """Load a cleaned retail sales file, reusing a cached Parquet copy.
+
+    The cache always holds every column; ``columns`` limits what is read
+    back from it.
+
+    Parameters
+    ----------
+    path : str
+        Path to a cleaned ``.csv`` or ``.parquet`` file.
+    columns : list[str], optional
+        Only return these columns.  All columns are returned by default.
+
+    Returns
+    -------
+    pd.DataFrame
+        Cleaned retail sales data with Arrow-backed columns.
+    """
+    if path.endswith('.parquet'):
+        return read_cleaned(path, columns)
+
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    path_key = hashlib.blake2b(path.encode(), digest_size=16).hexdigest()
+    file_key = hashlib.blake2b(
+        f"{CACHE_VERSION}|{st.st_mtime_ns}|{st.st_size}".encode(), digest_size=16).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f'{path_key}-{file_key}.parquet')
+    if os.path.exists(cache_path):
+        return read_cleaned(cache_path, columns)
+
+    df = read_cleaned(path)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Write to a temporary file first so concurrent runs never see a partial cache
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    pq.write_table(table.cast(parquet_schema(table.schema)), tmp_path)
+    os.replace(tmp_path, cache_path)
+    # Remove the copies cached for earlier versions of the same input file
+    for old_path in glob.glob(os.path.join(CACHE_DIR, f'{path_key}-*.parquet')):
+        if old_path != cache_path:
+            try:
+                os.remove(old_path)
+            except FileNotFoundError:  # already removed by a concurrent run
+                pass
+    return df if columns is None else df[columns]
@@ -0,0 +1,44 @@
+"""
+kernels.py
+==========
+
+Numba kernels used by the analysis scripts.
+
+Every kernel is compiled eagerly against an explicit signature with
+``cache=True``, so the machine code is written to disk on first use and
+reloaded by later runs instead of being recompiled.  Keeping the kernels in
+one module means every script that uses them shares a single cache.
+The cache lives in ``__pycache__`` next to this file unless
+``NUMBA_CACHE_DIR`` points elsewhere.
+
+Input arrays are declared read-only with any layout, because zero-copy
+``to_numpy()`` views of pandas columns may be non-writable or strided (e.g.
+after ``df.iloc[::2]``); writable, contiguous arrays are accepted as well.
+"""
+
+import numpy as np
+from numba import njit, types
+
+_f64_in = types.Array(types.float64, 1, 'A', readonly=True)
+_i64_in = types.Array(types.int64, 1, 'A', readonly=True)
+
+
+@njit(types.void(_i64_in, _f64_in, _f64_in, types.float64[::1], types.float64[::1],
+                 types.float64[::1], types.float64[::1]), cache=True)
+def group_sums(codes, rev, price, cnt, srev, pcnt, sprice):
+    """Accumulate revenue and unit price counts and sums per group in one pass.
+
+    The output arrays must hold one slot per group.  Rows with a negative
+    code (a missing key) are skipped, and a NaN value is left out of its own
+    column's count and sum only.
+    """
+    for i in range(codes.size):
+        c = codes[i]
+        if c < 0:
+            continue
+        if not np.isnan(rev[i]):
+            cnt[c] += 1
+            srev[c] += rev[i]
+        if not np.isnan(price[i]):
+            pcnt[c] += 1
+            sprice[c] += price[i]
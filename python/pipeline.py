@@ -0,0 +1,79 @@
+"""
+pipeline.py
+===========
+
+This script runs the cleaning step and the three question summaries as a
+single Polars lazy query over the raw retail sales CSV.  No cleaned file is
+written in between: Polars scans the raw CSV once, renames the columns,
+computes ``Revenue``, ``Basket Size`` and ``Month``, and runs the gender,
+month and product category group-bys in parallel.  Only the columns each
+summary needs are read and computed.
+
+Usage
+-----
+
+```
+python pipeline.py --input retail_sales_full_dataset.csv
+```
+
+The summaries match the output of ``q1_revenue_by_gender.py``,
+``q2_monthly_revenue.py`` and ``q3_product_performance.py``.
+"""
+
+import argparse
+import polars as pl
+
+import polars_summaries
+from clean_retail_data import RENAME_MAP
+
+
+def run(raw_csv: str) -> dict[str, pl.DataFrame]:
+    """Clean the raw CSV and compute all three summaries in one pass.
+
+    Parameters
+    ----------
+    raw_csv : str
+        Path to the raw retail sales CSV file.
+
+    Returns
+    -------
+    dict[str, pl.DataFrame]
+        The ``'gender'``, ``'month'`` and ``'category'`` summary tables.
+    """
+    lf = (
+        # Declare the numeric types up front, since inferring them from the
+        # first rows fails on decimals further down the file, and read empty
+        # (also quoted empty) cells as missing values like pandas does
+        pl.scan_csv(raw_csv, null_values=[''],
+                    schema_overrides={'Quantity': pl.Int64, 'Price per Unit': pl.Float64})
+          .rename(RENAME_MAP)
+          .with_columns([
+              (pl.col('Quantity') * pl.col('PricePerUnit')).alias('Revenue'),
+              pl.col('Quantity').alias('Basket Size'),
+              # Dates may or may not carry a time of day; the month only
+              # needs the leading YYYY-MM-DD
+              pl.col('SaleDate').str.slice(0, 10).str.to_date('%Y-%m-%d', strict=False)
+                .dt.strftime('%Y-%m').alias('Month'),
+          ])
+    )
+    gender, month, category = pl.collect_all([
+        polars_summaries.summarise_by_gender(lf),
+        polars_summaries.summarise_by_month(lf),
+        polars_summaries.summarise_by_category(lf),
+    ])
+    return {'gender': gender, 'month': month, 'category': category}
+
+
+def main(input_path: str) -> None:
+    results = run(input_path)
+    print("Revenue by gender:\n", results['gender'].to_pandas().to_string(index=False))
+    print("\nMonthly revenue:\n", results['month'].to_pandas().to_string(index=False))
+    print("\nRevenue by product category:\n", results['category'].to_pandas().to_string(index=False))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Clean the raw data and summarise it in one pass")
+    parser.add_argument('-i', '--input', dest='input_path', required=True,
+                        help='Path to the raw CSV file')
+    args = parser.parse_args()
+    main(args.input_path)
@@ -0,0 +1,118 @@
+"""
+polars_summaries.py
+===================
+
+Polars implementations of the summaries produced by the question scripts
+(``q1_revenue_by_gender.py``, ``q2_monthly_revenue.py`` and
+``q3_product_performance.py``).  Polars runs its group-bys on multiple
+threads over Arrow memory, which makes it a faster alternative to the
+pandas versions for larger datasets.
+
+Each summary function accepts either a ``pl.DataFrame`` or a
+``pl.LazyFrame`` and returns the same type, with the same column names as
+its pandas counterpart.  As in pandas, rows with a missing key are dropped
+and missing values are left out of counts, sums and means.  Convert the
+result with ``.to_pandas()`` when a pandas object is needed (e.g. for
+printing or plotting).
+"""
+
+import polars as pl
+
+# Numeric column types of the cleaned CSV.  Whole amounts are written without
+# a decimal point, so inferring the types from the first rows can pick an
+# integer type for a column that holds decimals further down.
+CSV_SCHEMA = {
+    'Quantity': pl.Int64,
+    'Basket Size': pl.Int64,
+    'PricePerUnit': pl.Float64,
+    'TotalAmount': pl.Float64,
+    'Revenue': pl.Float64,
+}
+
+def load_data(path: str, columns: list[str] | None = None) -> pl.DataFrame:
+    """Load the cleaned retail sales file into a Polars DataFrame.
+
+    Parameters
+    ----------
+    path : str
+        Path to the cleaned ``.parquet`` or ``.csv`` file.
+    columns : list[str], optional
+        Only read these columns.  All columns are read by default.
+
+    Returns
+    -------
+    pl.DataFrame
+        Cleaned retail sales data.
+    """
+    if path.endswith('.parquet'):
+        return pl.read_parquet(path, columns=columns)
+    return pl.read_csv(path, columns=columns, schema_overrides=CSV_SCHEMA)
+
+
+def summarise_by_gender(df):
+    """Summarise revenue and basket size statistics by gender.
+
+    Parameters
+    ----------
+    df : pl.DataFrame or pl.LazyFrame
+        Cleaned retail sales data.
+
+    Returns
+    -------
+    pl.DataFrame or pl.LazyFrame
+        Summary table per gender, sorted by total revenue.
+    """
+    return (
+        df.drop_nulls('Gender')
+          .group_by('Gender')
+          .agg([pl.col('Revenue').count().alias('Transactions'),
+                pl.col('Revenue').cast(pl.Float64).sum().alias('TotalRevenue'),
+                pl.col('Revenue').cast(pl.Float64).mean().alias('AvgRevenue'),
+                pl.col('Basket Size').mean().alias('AvgBasketSize')])
+          .sort('TotalRevenue', descending=True)
+    )
+
+
+def summarise_by_month(df):
+    """Aggregate revenue by month.
+
+    Parameters
+    ----------
+    df : pl.DataFrame or pl.LazyFrame
+        Cleaned retail sales data.
+
+    Returns
+    -------
+    pl.DataFrame or pl.LazyFrame
+        Monthly revenue totals sorted chronologically.
+    """
+    return (
+        df.drop_nulls('Month')
+          .group_by('Month')
+          .agg(pl.col('Revenue').cast(pl.Float64).sum().alias('TotalRevenue'))
+          .sort('Month')
+    )
+
+
+def summarise_by_category(df):
+    """Compute performance metrics for each product category.
+
+    Parameters
+    ----------
+    df : pl.DataFrame or pl.LazyFrame
+        Cleaned retail sales data.
+
+    Returns
+    -------
+    pl.DataFrame or pl.LazyFrame
+        Summary table per product category, sorted by total revenue.
+    """
+    return (
+        df.drop_nulls('ProductCategory')
+          .group_by('ProductCategory')
+          .agg([pl.col('Revenue').count().alias('Transactions'),
+                pl.col('Revenue').cast(pl.Float64).sum().alias('TotalRevenue'),
+                pl.col('Revenue').cast(pl.Float64).mean().alias('AvgRevenue'),
+                pl.col('PricePerUnit').cast(pl.Float64).mean().alias('AvgUnitPrice')])
+          .sort('TotalRevenue', descending=True)
+    )
@@ -5,24 +5,31 @@ q1_revenue_by_gender.py
 This script answers Question 1 from the Retail Sales Insights project:
 **Which customer segments contribute most to revenue?**
 
-It loads the cleaned retail sales CSV, groups transactions by gender and
-computes summary metrics: transaction count, total revenue, average
-revenue and average basket size.  The results are printed to the
+It loads the cleaned retail sales file (Parquet or CSV), groups
+transactions by gender and computes summary metrics: transaction count,
+total revenue, average revenue and average basket size.  The results are printed to the
 console and can optionally be saved to a CSV file.
 
 Usage
 -----
 
 ```
-python q1_revenue_by_gender.py --input retail_sales_clean.csv
+python q1_revenue_by_gender.py --input retail_sales_clean.parquet
 ```
 
 You can specify ``--output`` to write the summary table to a file.
+Pass ``--engine polars`` to run the aggregation with Polars instead of pandas.
 """
 
 import argparse
+import numpy as np
 import pandas as pd
 
+from io_cache import load_cached
+
+# Columns read from the cleaned file; the rest are never loaded
+COLUMNS = ['Gender', 'Revenue', 'Basket Size']
+
 
 def summarise_by_gender(df: pd.DataFrame) -> pd.DataFrame:
     """Summarise revenue and basket size statistics by gender.
@@ -37,21 +44,47 @@ def summarise_by_gender(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Summary table indexed by gender.
     """
-    summary = (
-        df.groupby('Gender')
-          .agg(Transactions=('Revenue', 'count'),
-               TotalRevenue=('Revenue', 'sum'),
-               AvgRevenue=('Revenue', 'mean'),
-               AvgBasketSize=('Basket Size', 'mean'))
-          .reset_index()
-          .sort_values('TotalRevenue', ascending=False)
-    )
+    # Gender has only a handful of values, so weighted bincounts over the
+    # factorised codes are much cheaper than a hash-based groupby
+    codes, genders = pd.factorize(df['Gender'])
+    n = len(genders)
+    revenue = df['Revenue'].to_numpy(np.float64, na_value=np.nan)
+    basket = df['Basket Size'].to_numpy(np.float64, na_value=np.nan)
+    # Like groupby's count/sum/mean, skip missing values column by column
+    has_revenue = (codes >= 0) & ~np.isnan(revenue)
+    has_basket = (codes >= 0) & ~np.isnan(basket)
+    transactions = np.bincount(codes[has_revenue], minlength=n)
+    total_revenue = np.bincount(codes[has_revenue], weights=revenue[has_revenue], minlength=n)
+    baskets = np.bincount(codes[has_basket], minlength=n)
+    total_basket = np.bincount(codes[has_basket], weights=basket[has_basket], minlength=n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        summary = pd.DataFrame({
+            'Gender': genders,
+            'Transactions': transactions,
+            'TotalRevenue': total_revenue,
+            'AvgRevenue': total_revenue / transactions,
+            'AvgBasketSize': total_basket / baskets,
+        }).sort_values('TotalRevenue', ascending=False)
     return summary
 
 
-def main(input_path: str, output_path: str | None) -> None:
-    df = pd.read_csv(input_path)
-    summary = summarise_by_gender(df)
+def main(input_path: str | None = None, output_path: str | None = None,
+         engine: str = 'pandas', df: pd.DataFrame | None = None) -> None:
+    if input_path is None and df is None:
+        raise ValueError("Either input_path or df must be given")
+    if df is not None and engine == 'polars':
+        raise ValueError("engine='polars' reads input_path itself and cannot use a preloaded df")
+    # A preloaded DataFrame lets callers share one load across several summaries
+    if df is not None:
+        summary = summarise_by_gender(df)
+    elif engine == 'polars':
+        # Imported here so that Polars is only required for this engine
+        import polars_summaries
+        summary = polars_summaries.summarise_by_gender(
+            polars_summaries.load_data(input_path, COLUMNS)).to_pandas()
+    else:
+        df = load_cached(input_path, COLUMNS)
+        summary = summarise_by_gender(df)
     print("Revenue by gender:\n", summary.to_string(index=False))
     if output_path:
         summary.to_csv(output_path, index=False)
@@ -60,9 +93,11 @@ def main(input_path: str, output_path: str | None) -> None:
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Summarise revenue by gender")
-    parser.add_argument('-i', '--input', dest='input_path', default='retail_sales_clean.csv',
-                        help='Path to the cleaned retail sales CSV file')
+    parser.add_argument('-i', '--input', dest='input_path', default='retail_sales_clean.parquet',
+                        help='Path to the cleaned retail sales Parquet or CSV file')
     parser.add_argument('-o', '--output', dest='output_path', default=None,
                         help='Optional path to save the summary CSV')
+    parser.add_argument('-e', '--engine', dest='engine', choices=('pandas', 'polars'), default='pandas',
+                        help='DataFrame library used for the aggregation (default: pandas)')
     args = parser.parse_args()
-    main(args.input_path, args.output_path)
\ No newline at end of file
+    main(args.input_path, args.output_path, args.engine)
\ No newline at end of file
@@ -5,23 +5,31 @@ q2_monthly_revenue.py
 This script answers Question 2 from the Retail Sales Insights project:
 **How does the timing or frequency of purchases affect revenue?**
 
-It loads the cleaned retail sales CSV, aggregates total revenue by month
-and displays the results.  Optionally, the monthly revenue can be
+It loads the cleaned retail sales file (Parquet or CSV), aggregates total
+revenue by month and displays the results.  Optionally, the monthly revenue can be
 exported to a CSV file for further analysis or visualisation.
 
 Usage
 -----
 
 ```
-python q2_monthly_revenue.py --input retail_sales_clean.csv
+python q2_monthly_revenue.py --input retail_sales_clean.parquet
 ```
 
 Specify ``--output`` to save the monthly revenue table to disk.
+Pass ``--engine polars`` to run the aggregation with Polars instead of pandas.
 """
 
 import argparse
+import numpy as np
 import pandas as pd
 
+from clean_retail_data import format_month
+from io_cache import load_cached
+
+# Columns read from the cleaned file; the rest are never loaded
+COLUMNS = ['Month', 'Revenue']
+
 
 def summarise_by_month(df: pd.DataFrame) -> pd.DataFrame:
     """Aggregate revenue by month.
@@ -36,18 +44,38 @@ def summarise_by_month(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Monthly revenue totals sorted chronologically.
     """
-    monthly = (
-        df.groupby('Month')
-          .agg(TotalRevenue=('Revenue', 'sum'))
-          .reset_index()
-          .sort_values('Month')
-    )
+    # There are only a few dozen months, so a weighted bincount over the
+    # factorised codes is much cheaper than a hash-based groupby.  Sorting
+    # the unique months while factorising yields chronological output
+    # without a separate sort of the result (YYYY-MM strings and YYYYMM
+    # integers both sort chronologically).
+    codes, months = pd.factorize(df['Month'], sort=True)
+    revenue = df['Revenue'].to_numpy(np.float64, na_value=np.nan)
+    # Skip missing months and missing revenue, as groupby's sum does
+    valid = (codes >= 0) & ~np.isnan(revenue)
+    revenue = np.bincount(codes[valid], weights=revenue[valid], minlength=len(months))
+    monthly = pd.DataFrame({'Month': months, 'TotalRevenue': revenue})
     return monthly
 
 
-def main(input_path: str, output_path: str | None) -> None:
-    df = pd.read_csv(input_path)
-    monthly = summarise_by_month(df)
+def main(input_path: str | None = None, output_path: str | None = None,
+         engine: str = 'pandas', df: pd.DataFrame | None = None) -> None:
+    if input_path is None and df is None:
+        raise ValueError("Either input_path or df must be given")
+    if df is not None and engine == 'polars':
+        raise ValueError("engine='polars' reads input_path itself and cannot use a preloaded df")
+    # A preloaded DataFrame lets callers share one load across several summaries
+    if df is not None:
+        monthly = summarise_by_month(df)
+    elif engine == 'polars':
+        # Imported here so that Polars is only required for this engine
+        import polars_summaries
+        monthly = polars_summaries.summarise_by_month(
+            polars_summaries.load_data(input_path, COLUMNS)).to_pandas()
+    else:
+        df = load_cached(input_path, COLUMNS)
+        monthly = summarise_by_month(df)
+    monthly['Month'] = format_month(monthly['Month'])
     print("Monthly revenue:\n", monthly.to_string(index=False))
     if output_path:
         monthly.to_csv(output_path, index=False)
@@ -56,9 +84,11 @@ def main(input_path: str, output_path: str | None) -> None:
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Aggregate revenue by month")
-    parser.add_argument('-i', '--input', dest='input_path', default='retail_sales_clean.csv',
-                        help='Path to the cleaned retail sales CSV file')
+    parser.add_argument('-i', '--input', dest='input_path', default='retail_sales_clean.parquet',
+                        help='Path to the cleaned retail sales Parquet or CSV file')
     parser.add_argument('-o', '--output', dest='output_path', default=None,
                         help='Optional path to save the monthly revenue CSV')
+    parser.add_argument('-e', '--engine', dest='engine', choices=('pandas', 'polars'), default='pandas',
+                        help='DataFrame library used for the aggregation (default: pandas)')
     args = parser.parse_args()
-    main(args.input_path, args.output_path)
\ No newline at end of file
+    main(args.input_path, args.output_path, args.engine)
\ No newline at end of file
@@ -5,9 +5,9 @@ q3_product_performance.py
 This script answers Question 3 from the Retail Sales Insights project:
 **If we could only stock or promote a limited range of products, which ones should be prioritised?**
 
-It loads the cleaned retail sales CSV, summarises performance metrics by
-product category (transaction count, total revenue, average revenue
-and average unit price) and sorts the categories by total revenue in
+It loads the cleaned retail sales file (Parquet or CSV), summarises
+performance metrics by product category (transaction count, total
+revenue, average revenue and average unit price) and sorts the categories by total revenue in
 descending order.  The results can be printed to the console and
 optionally saved to a CSV file.
 
@@ -15,15 +15,22 @@ Usage
 -----
 
 ```
-python q3_product_performance.py --input retail_sales_clean.csv
+python q3_product_performance.py --input retail_sales_clean.parquet
 ```
 
 Add ``--output`` to save the summary.
+Pass ``--engine polars`` to run the aggregation with Polars instead of pandas.
 """
 
 import argparse
+import numpy as np
 import pandas as pd
 
+from io_cache import load_cached
+
+# Columns read from the cleaned file; the rest are never loaded
+COLUMNS = ['ProductCategory', 'Revenue', 'PricePerUnit']
+
 
 def summarise_by_category(df: pd.DataFrame) -> pd.DataFrame:
     """Compute performance metrics for each product category.
@@ -38,21 +45,45 @@ def summarise_by_category(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Summary table indexed by product category, sorted by total revenue.
     """
-    summary = (
-        df.groupby('ProductCategory')
-          .agg(Transactions=('Revenue', 'count'),
-               TotalRevenue=('Revenue', 'sum'),
-               AvgRevenue=('Revenue', 'mean'),
-               AvgUnitPrice=('PricePerUnit', 'mean'))
-          .reset_index()
-          .sort_values('TotalRevenue', ascending=False)
-    )
+    # Imported here so that loading this module does not load Numba
+    from kernels import group_sums
+
+    codes, categories = pd.factorize(df['ProductCategory'])
+    n_groups = len(categories)
+    cnt = np.zeros(n_groups)
+    srev = np.zeros(n_groups)
+    pcnt = np.zeros(n_groups)
+    sprice = np.zeros(n_groups)
+    group_sums(codes.astype(np.int64, copy=False), df['Revenue'].to_numpy(np.float64, na_value=np.nan),
+               df['PricePerUnit'].to_numpy(np.float64, na_value=np.nan), cnt, srev, pcnt, sprice)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        summary = pd.DataFrame({
+            'ProductCategory': categories,
+            'Transactions': cnt.astype(np.int64),
+            'TotalRevenue': srev,
+            'AvgRevenue': srev / cnt,
+            'AvgUnitPrice': sprice / pcnt,
+        }).sort_values('TotalRevenue', ascending=False)
     return summary
 
 
-def main(input_path: str, output_path: str | None) -> None:
-    df = pd.read_csv(input_path)
-    summary = summarise_by_category(df)
+def main(input_path: str | None = None, output_path: str | None = None,
+         engine: str = 'pandas', df: pd.DataFrame | None = None) -> None:
+    if input_path is None and df is None:
+        raise ValueError("Either input_path or df must be given")
+    if df is not None and engine == 'polars':
+        raise ValueError("engine='polars' reads input_path itself and cannot use a preloaded df")
+    # A preloaded DataFrame lets callers share one load across several summaries
+    if df is not None:
+        summary = summarise_by_category(df)
+    elif engine == 'polars':
+        # Imported here so that Polars is only required for this engine
+        import polars_summaries
+        summary = polars_summaries.summarise_by_category(
+            polars_summaries.load_data(input_path, COLUMNS)).to_pandas()
+    else:
+        df = load_cached(input_path, COLUMNS)
+        summary = summarise_by_category(df)
     print("Revenue by product category:\n", summary.to_string(index=False))
     if output_path:
         summary.to_csv(output_path, index=False)
@@ -61,9 +92,11 @@ def main(input_path: str, output_path: str | None) -> None:
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Summarise revenue by product category")
-    parser.add_argument('-i', '--input', dest='input_path', default='retail_sales_clean.csv',
-                        help='Path to the cleaned retail sales CSV file')
+    parser.add_argument('-i', '--input', dest='input_path', default='retail_sales_clean.parquet',
+                        help='Path to the cleaned retail sales Parquet or CSV file')
     parser.add_argument('-o', '--output', dest='output_path', default=None,
                         help='Optional path to save the product category summary CSV')
+    parser.add_argument('-e', '--engine', dest='engine', choices=('pandas', 'polars'), default='pandas',
+                        help='DataFrame library used for the aggregation (default: pandas)')
     args = parser.parse_args()
-    main(args.input_path, args.output_path)
\ No newline at end of file
+    main(args.input_path, args.output_path, args.engine)
\ No newline at end of file